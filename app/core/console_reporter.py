@@ -25,6 +25,9 @@ CATEGORY_EMOJIS = {
     "analysis": "\U0001f4ca",  # chart
 }
 
+# Bandit severity icons for issue samples (unknown severities get a white circle)
+SEVERITY_ICONS = {"HIGH": "🔴", "MEDIUM": "🟡"}
+
 
 class ConsoleReporter:
     """Handles Rich console output for audit results."""
@@ -303,7 +306,7 @@ class MarkdownReporter:
                     code = sample.get("code", "")
                     msg = sample.get("msg", "")
                     severity = sample.get("severity", "")
-                    sev_icon = "🔴" if severity == "HIGH" else "🟡" if severity == "MEDIUM" else "⚪"
+                    sev_icon = SEVERITY_ICONS.get(severity, "⚪")
                     lines.append(f"- {sev_icon} `{file_path}:{line_num}` **[{code}]** {msg}")
                 if bandit_total > 10:
                     lines.append(f"- *... and {bandit_total - 10} more issues*")
@@ -5,10 +5,13 @@ Jinja2 template rendering. It handles missing keys, inconsistent formats, and
 provides safe defaults to prevent "N/A" bugs.
 """
 
+import heapq
 import logging
 from collections import defaultdict
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -49,6 +52,14 @@ def _format_duration(seconds: float) -> str:
     return f"{hours}h {mins}m"
 
 
+def _resolve_repo_name(project_path: str) -> str:
+    """Directory name of the audited project; only hits the filesystem for '.'/'..'-style paths."""
+    path = Path(project_path)
+    if path.name and path.name != "..":
+        return path.name
+    return path.resolve().name
+
+
 def _extract_tool_data(raw_results: dict[str, Any], key: str) -> dict[str, Any]:
     """Extract tool data handling both flat and nested structures.
 
@@ -103,16 +114,20 @@ def build_report_context(
     security_severity = _get_security_severity(raw_results)
     coverage_severity = _get_coverage_severity(raw_results)
 
+    project_name = Path(project_path).name
+    # Format once; date and time are the fixed-width halves of the same string
+    formatted_timestamp = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
     return {
         # === METADATA ===
-        "project_name": Path(project_path).name,
-        "repo_name": Path(project_path).name,  # ADDED: for template compatibility
+        "project_name": project_name,
+        "repo_name": project_name,  # ADDED: for template compatibility
         "score": score,
         "grade": grade,  # ADDED: A/B/C/D/F
         "report_id": report_id,
-        "timestamp": timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-        "date": timestamp.strftime("%Y-%m-%d"),
-        "time": timestamp.strftime("%H:%M:%S"),
+        "timestamp": formatted_timestamp,
+        "date": formatted_timestamp[:10],
+        "time": formatted_timestamp[11:],
         "duration": _format_duration(duration) if duration else "N/A",  # Human-readable duration
         # === PENALTIES (for score breakdown table) ===
         "security_penalty": penalties["security"],
@@ -201,19 +216,28 @@ def _calculate_penalties(raw_results: dict[str, Any]) -> dict[str, int]:
     return penalties
 
 
-def _get_security_severity(raw_results: dict[str, Any]) -> dict[str, str]:
+# Context-level security severity: label + description by code-issue count (thresholds 5/15).
+# ReportGeneratorV2 replaces it with its own {level, label, count} classification of weighted
+# bandit + secrets totals (report_generator_v2._SECURITY_BANDS), so the two tables stay separate.
+_ISSUE_SEVERITY_CLEAN = MappingProxyType({"label": "✅ Clean", "description": "No security issues detected"})
+_ISSUE_SEVERITY_LOW = MappingProxyType({"label": "🟡 Low", "description": "Minor security issues found"})
+_ISSUE_SEVERITY_MEDIUM = MappingProxyType({"label": "🟠 Medium", "description": "Moderate security concerns"})
+_ISSUE_SEVERITY_HIGH = MappingProxyType({"label": "🔴 High", "description": "Significant security issues require attention"})
+
+
+def _get_security_severity(raw_results: dict[str, Any]) -> Mapping[str, str]:
     """Get security severity label and description."""
     security = raw_results.get("bandit") or raw_results.get("security", {})
 
     issues = len(security["code_security"].get("issues", [])) if "code_security" in security else len(security.get("issues", []))
 
     if issues == 0:
-        return {"label": "✅ Clean", "description": "No security issues detected"}
+        return _ISSUE_SEVERITY_CLEAN
     if issues < 5:
-        return {"label": "🟡 Low", "description": "Minor security issues found"}
+        return _ISSUE_SEVERITY_LOW
     if issues < 15:
-        return {"label": "🟠 Medium", "description": "Moderate security concerns"}
-    return {"label": "🔴 High", "description": "Significant security issues require attention"}
+        return _ISSUE_SEVERITY_MEDIUM
+    return _ISSUE_SEVERITY_HIGH
 
 
 def _get_coverage_severity(raw_results: dict[str, Any]) -> dict[str, str]:
@@ -605,6 +629,11 @@ def _normalize_efficiency(raw_results: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _group_size(item: tuple[str, list]) -> int:
+    """Sort key for (file, duplicates) groups."""
+    return len(item[1])
+
+
 def _normalize_duplication(raw_results: dict[str, Any]) -> dict[str, Any]:
     """Normalize code duplication data."""
     data = _extract_tool_data(raw_results, "duplication")
@@ -619,14 +648,15 @@ def _normalize_duplication(raw_results: dict[str, Any]) -> dict[str, Any]:
             primary_file = locations[0].split(":")[0]
             file_groups[primary_file].append(dup)
 
-    sorted_files = sorted(file_groups.items(), key=lambda x: -len(x[1]))
+    # Ten largest groups, ties kept in first-seen order
+    top_files = heapq.nlargest(10, file_groups.items(), key=_group_size)
 
     return {
         "available": bool(data),
         "total_duplicates": len(duplicates),
         "total_functions_analyzed": data.get("total_functions_analyzed", 0),
         "duplicates": duplicates,
-        "file_groups": sorted_files[:10],
+        "file_groups": top_files,
         "has_duplicates": len(duplicates) > 0,
     }
 
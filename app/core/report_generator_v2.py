@@ -9,355 +9,88 @@ Benefits:
 """
 
 import logging
+import math
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
-from app.core.report_context import build_report_context
+from app.core.report_context import _resolve_repo_name, build_report_context
 from app.core.report_validator import ReportValidator
 from app.core.scoring_engine import ScoringEngine
 
 logger = logging.getLogger(__name__)
 
 
-def _get_coverage_severity(coverage: float) -> dict:
+# Coverage bands above 0%: upper bounds (exclusive) and (level, label, description, recommendation)
+_COVERAGE_BOUNDS = (10, 30, 50, 70)
+_COVERAGE_BANDS = (
+    ("critical", "❌ Critical", "Virtually no test coverage ({}%)", "Increase coverage to at least 30%"),
+    ("high", "🔴 Very Low", "Insufficient test coverage ({}%)", "Add tests for critical paths"),
+    ("medium", "🟡 Low", "Below recommended coverage ({}%)", "Aim for 70%+ coverage"),
+    ("low", "🟢 Moderate", "Acceptable coverage ({}%)", "Continue improving to 80%+"),
+    ("info", "✅ Good", "Good test coverage ({}%)", "Maintain current standards"),
+)
+
+
+# Value-independent results are shared, read-only instances
+_NO_COVERAGE = MappingProxyType(
+    {
+        "level": "critical",
+        "label": "❌ Critical",
+        "description": "No test coverage detected",
+        "recommendation": "Add unit tests immediately",
+    }
+)
+
+
+def _get_coverage_severity(coverage: float) -> Mapping[str, Any]:
     """Returns object with severity + structured explanation"""
     if coverage == 0:
-        return {
-            "level": "critical",
-            "label": "❌ Critical",
-            "description": "No test coverage detected",
-            "recommendation": "Add unit tests immediately",
-        }
-    if coverage < 10:
-        return {
-            "level": "critical",
-            "label": "❌ Critical",
-            "description": f"Virtually no test coverage ({coverage}%)",
-            "recommendation": "Increase coverage to at least 30%",
-        }
-    if coverage < 30:
-        return {
-            "level": "high",
-            "label": "🔴 Very Low",
-            "description": f"Insufficient test coverage ({coverage}%)",
-            "recommendation": "Add tests for critical paths",
-        }
-    if coverage < 50:
-        return {
-            "level": "medium",
-            "label": "🟡 Low",
-            "description": f"Below recommended coverage ({coverage}%)",
-            "recommendation": "Aim for 70%+ coverage",
-        }
-    if coverage < 70:
-        return {
-            "level": "low",
-            "label": "🟢 Moderate",
-            "description": f"Acceptable coverage ({coverage}%)",
-            "recommendation": "Continue improving to 80%+",
-        }
+        return _NO_COVERAGE
+    level, label, description, recommendation = _COVERAGE_BANDS[bisect_right(_COVERAGE_BOUNDS, coverage)]
     return {
-        "level": "info",
-        "label": "✅ Good",
-        "description": f"Good test coverage ({coverage}%)",
-        "recommendation": "Maintain current standards",
+        "level": level,
+        "label": label,
+        "description": description.format(coverage),
+        "recommendation": recommendation,
     }
 
 
-def _get_security_severity(bandit_issues: int, secrets: int) -> dict:
+# Non-zero weighted security totals: upper bounds (inclusive) and (level, label)
+_SECURITY_BOUNDS = (3, 10)
+_SECURITY_BANDS = (("low", "🟡 Minor"), ("medium", "🟠 Moderate"), ("high", "🔴 Critical"))
+_SECURITY_CLEAN = MappingProxyType({"level": "info", "label": "✅ Clean", "count": 0})
+
+
+def _get_security_severity(bandit_issues: int, secrets: int) -> Mapping[str, Any]:
     """Returns object with security severity classification"""
     total = bandit_issues + (secrets * 2)  # secrets are more severe
 
     if total == 0:
-        return {"level": "info", "label": "✅ Clean", "count": 0}
-    if total <= 3:
-        return {"level": "low", "label": "🟡 Minor", "count": total}
-    if total <= 10:
-        return {"level": "medium", "label": "🟠 Moderate", "count": total}
-    return {"level": "high", "label": "🔴 Critical", "count": total}
-
-
-class ReportGeneratorV2:
-    """Generate comprehensive markdown reports using Jinja2 templates."""
-
-    def __init__(self, reports_dir: Path):
-        self.reports_dir = reports_dir
-        self.reports_dir.mkdir(parents=True, exist_ok=True)
-
-        # Initialize Jinja2 environment
-        template_dir = Path(__file__).parent.parent / "templates"
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=select_autoescape(["html", "xml"]),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
-        # Add custom filters
-        self.env.filters["round"] = lambda x, decimals=2: round(float(x), decimals) if x else 0
-
-        logger.info(f"✅ Jinja2 template engine initialized (templates: {template_dir})")
-
-    def _calculate_total_duration(self, tool_results: dict[str, Any]) -> float | None:
-        """Calculate total duration from individual tool execution times.
-
-        Handles multiple formats:
-        - execution_time_ms: milliseconds (from JSON-first architecture)
-        - duration_s: seconds (from parallel audit)
-        """
-        total_ms = 0
-        found_any = False
-
-        for value in tool_results.values():
-            if not isinstance(value, dict):
-                continue
-
-            # Check for execution_time_ms (JSON-first format)
-            if "execution_time_ms" in value:
-                total_ms += value["execution_time_ms"]
-                found_any = True
-            # Check for duration_s (parallel audit format)
-            elif "duration_s" in value:
-                try:
-                    duration_s = float(value["duration_s"])
-                    total_ms += duration_s * 1000
-                    found_any = True
-                except (ValueError, TypeError):
-                    pass
-
-        if found_any:
-            return total_ms / 1000.0  # Convert to seconds
-        return None
-
-    def generate_report(
-        self,
-        report_id: str,
-        project_path: str,
-        score: int,
-        tool_results: dict[str, Any],
-        timestamp: datetime,
-        scanned_files: list[str] | None = None,
-    ) -> str:
-        """Generate an audit report using Jinja2 template rendering with pre-calculated scores.
+        return _SECURITY_CLEAN
+    level, label = _SECURITY_BANDS[bisect_left(_SECURITY_BOUNDS, total)]
+    return {"level": level, "label": label, "count": total}
 
-        Args:
-            report_id: Unique report identifier
-            project_path: Path to the project being audited
-            score: Overall audit score (0-100) - DEPRECATED, will be calculated
-            tool_results: Raw results from all audit tools
-            timestamp: Report generation timestamp
-            scanned_files: Optional list of files that were scanned
 
-        Returns:
-            Path to the generated report file
+# HTML score badge colour: lower bounds (inclusive) of the orange, amber and green bands
+_SCORE_COLOR_BOUNDS = (50, 70, 90)
+_SCORE_COLORS = ("#ef4444", "#f97316", "#f59e0b", "#22c55e")  # red, orange, amber, green
 
-        """
-        try:
-            # Step 1: Calculate scores using deterministic engine (NOT LLM!)
-            logger.info("Calculating scores using ScoringEngine...")
-            score_breakdown = ScoringEngine.calculate_score(tool_results)
-            logger.info(f"Score calculated: {score_breakdown.final_score}/100 ({score_breakdown.grade})")
-
-            # Step 2: Build normalized context
-            logger.info("Building normalized report context...")
-
-            # Extract duration from tool_results if available
-            duration = tool_results.get("duration_seconds") or tool_results.get("duration")
-            if isinstance(duration, str):
-                # Try to parse string duration (e.g., "12.34s")
-                try:
-                    duration = float(duration.rstrip("s"))
-                except (ValueError, AttributeError):
-                    duration = None
-
-            # If no duration at root, calculate from individual tool execution times
-            if duration is None:
-                duration = self._calculate_total_duration(tool_results)
-
-            context = build_report_context(
-                raw_results=tool_results,
-                project_path=project_path,
-                score=score_breakdown.final_score,  # Use calculated score
-                report_id=report_id,
-                timestamp=timestamp,
-                duration=duration,  # ADDED: pass duration parameter
-            )
-
-            # Debug logging to identify data structure issues
-            logger.debug(f"tool_results keys: {list(tool_results.keys())}")
-            if "tests" in tool_results:
-                logger.debug(f"tests type: {type(tool_results.get('tests'))}")
-
-            # Safe extraction with type validation
-            tests_data = tool_results.get("tests", {})
-            if isinstance(tests_data, dict):
-                coverage = tests_data.get("coverage_percent", 0)
-            else:
-                coverage = 0
-                logger.warning(f"Tests data is not a dict: {type(tests_data)}")
-
-            bandit_data = tool_results.get("bandit", {})
-            if isinstance(bandit_data, dict):
-                bandit_issues = bandit_data.get("total_issues", 0)
-            else:
-                bandit_issues = 0
-                logger.warning(f"Bandit data is not a dict: {type(bandit_data)}")
-
-            secrets_data = tool_results.get("secrets", {})
-            if isinstance(secrets_data, dict):
-                secrets_count = secrets_data.get("total_secrets", 0)
-            else:
-                secrets_count = 0
-                logger.warning(f"Secrets data is not a dict: {type(secrets_data)}")
-
-            # Pre-classified severities (prevent hallucination)
-            context.update(
-                {
-                    # Calculated scores - these WON'T change!
-                    "score": score_breakdown.final_score,
-                    "grade": score_breakdown.grade,
-                    "security_penalty": score_breakdown.security_penalty,
-                    "quality_penalty": score_breakdown.quality_penalty,
-                    "testing_penalty": score_breakdown.testing_penalty,
-                    "coverage_severity": _get_coverage_severity(coverage),
-                    "security_severity": _get_security_severity(bandit_issues, secrets_count),
-                    # Template-specific fields
-                    "repo_name": Path(project_path).resolve().name,
-                    # "duration": "PRESERVED_FROM_CONTEXT", # Don't overwrite correct duration from build_report_context
-                    "timestamp": timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-                    # Raw results for template access
-                    "raw_results": tool_results,
-                }
-            )
 
-            # Step 4: Load template
-            logger.info("Loading Jinja2 template...")
-            template = self.env.get_template("audit_report_v3.md.j2")  # Use new template
-
-            # Step 5: Render report
-            logger.info("Rendering report...")
-            report_content = template.render(**context)
-
-            # Step 6: Validation
-            validator = ReportValidator()
-            errors = validator.validate_consistency(tool_results, report_content, score_breakdown)
-            if errors:
-                logger.warning(f"⚠️ Report inconsistencies detected: {errors}")
-                # Append warning to report
-                report_content += "\n\n---\n\n## ⚠️ Report Validation Warnings\n\n"
-                for error in errors:
-                    report_content += f"- {error}\n"
-            else:
-                logger.info("✅ Report validation passed - no inconsistencies detected")
-
-            # Step 7: Write to file
-            report_path = self.reports_dir / f"{report_id}.md"
-            with open(report_path, "w", encoding="utf-8") as f:
-                f.write(report_content)
-
-            # Step 8: Append integrity validation if scanned_files provided
-            if scanned_files:
-                self._append_integrity_validation(report_path, scanned_files)
-
-            logger.info(f"✅ Report generated successfully: {report_path}")
-            return str(report_path)
-
-        except Exception as e:
-            logger.error(f"❌ Report generation failed: {e}", exc_info=True)
-            raise
-
-    def _append_integrity_validation(self, report_path: Path, scanned_files: list[str]) -> None:
-        """Append integrity validation section to the report."""
-        try:
-            from app.core.audit_validator import validate_report_integrity
-
-            # Read the generated report
-            with open(report_path, encoding="utf-8") as f:
-                report_text = f.read()
-
-            # Generate validation section
-            validation_section = validate_report_integrity(report_text, scanned_files)
-
-            # Append validation to report
-            with open(report_path, "a", encoding="utf-8") as f:
-                f.write("\n\n---\n\n")
-                f.write(validation_section)
-
-            logger.info(f"✅ Integrity validation appended ({len(scanned_files)} files verified)")
-
-        except ImportError:
-            logger.warning("⚠️ audit_validator module not found, skipping integrity check")
-        except Exception as e:
-            logger.exception(f"❌ Integrity validation failed: {e}")
-
-    def generate_html_report(
-        self,
-        report_id: str,
-        project_path: str,
-        score: int,
-        tool_results: dict[str, Any],
-        timestamp: datetime,
-        scanned_files: list[str] | None = None,
-    ) -> str:
-        """Generate an HTML audit report with styling.
-
-        Args:
-            report_id: Unique report identifier
-            project_path: Path to the project being audited
-            score: Overall audit score (0-100) - will be recalculated
-            tool_results: Raw results from all audit tools
-            timestamp: Report generation timestamp
-            scanned_files: Optional list of files that were scanned
-
-        Returns:
-            Path to the generated HTML report file
-
-        """
-        try:
-            import markdown
-
-            # First generate the markdown report
-            md_report_path = self.generate_report(
-                report_id=report_id,
-                project_path=project_path,
-                score=score,
-                tool_results=tool_results,
-                timestamp=timestamp,
-                scanned_files=scanned_files,
-            )
-
-            # Read the markdown content
-            with open(md_report_path, encoding="utf-8") as f:
-                md_content = f.read()
-
-            # Convert to HTML
-            html_body = markdown.markdown(md_content, extensions=["tables", "fenced_code", "toc"])
-
-            # Calculate score for styling
-            score_breakdown = ScoringEngine.calculate_score(tool_results)
-            score = score_breakdown.final_score
-            grade = score_breakdown.grade
-
-            # Determine score color
-            if score >= 90:
-                score_color = "#22c55e"  # green
-            elif score >= 70:
-                score_color = "#f59e0b"  # amber
-            elif score >= 50:
-                score_color = "#f97316"  # orange
-            else:
-                score_color = "#ef4444"  # red
-
-            # Wrap in HTML template
-            html_content = f"""<!DOCTYPE html>
+# Page shell wrapped around the converted markdown in generate_html_report (CSS braces are doubled for str.format)
+_HTML_SHELL = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Audit Report - {Path(project_path).name}</title>
+    <title>Audit Report - {project_name}</title>
     <style>
         :root {{
             --primary: #3b82f6;
@@ -459,8 +192,8 @@ class ReportGeneratorV2:
         <div class="header">
             <div>
                 <h1>Python Audit Report</h1>
-                <p>{Path(project_path).name}</p>
-                <p style="opacity: 0.8; font-size: 0.9rem;">{timestamp.strftime("%Y-%m-%d %H:%M:%S")}</p>
+                <p>{project_name}</p>
+                <p style="opacity: 0.8; font-size: 0.9rem;">{timestamp}</p>
             </div>
             <div class="score-badge">
                 {score}
@@ -477,10 +210,363 @@ class ReportGeneratorV2:
 </body>
 </html>"""
 
+
+_TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+
+# Jinja2 environments by template directory, shared by all generator instances
+_ENV_CACHE: dict[Path, Environment] = {}
+_ENV_LOCK = threading.Lock()
+
+
+def _round_filter(x: Any, decimals: int = 2) -> float:
+    """Jinja 'round' filter: numeric strings accepted, falsy values render as 0."""
+    if not x:
+        return 0
+    # Metrics are usually floats already; ints still go through float() so they render as e.g. 5.0
+    if type(x) is float:
+        return round(x, decimals)
+    return round(float(x), decimals)
+
+
+def _get_bytecode_cache() -> FileSystemBytecodeCache | None:
+    """Opt-in on-disk cache of compiled templates, enabled with AUDITOR_JINJA_BYTECODE_CACHE=1.
+
+    Entries are keyed by template source checksum, so edited templates are recompiled.
+    """
+    if os.getenv("AUDITOR_JINJA_BYTECODE_CACHE") != "1":
+        return None
+
+    try:
+        # Path.home() raises RuntimeError when HOME cannot be determined
+        cache_dir = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "mcp-python-auditor" / "jinja"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except (OSError, RuntimeError) as e:
+        logger.warning(f"⚠️ Jinja2 bytecode cache disabled, no usable cache directory: {e}")
+        return None
+    return FileSystemBytecodeCache(directory=str(cache_dir))
+
+
+def _get_env(template_dir: Path) -> Environment:
+    """Return the Jinja2 environment for template_dir, creating it on first use.
+
+    Templates are treated as immutable for the lifetime of the process: auto_reload
+    is off, so edits to a .j2 file are picked up only after a restart.
+    """
+    env = _ENV_CACHE.get(template_dir)
+    if env is not None:
+        return env
+
+    # Generators may be created from worker threads; build each environment only once
+    with _ENV_LOCK:
+        env = _ENV_CACHE.get(template_dir)
+        if env is not None:
+            return env
+
+        # Templates ship with the package, so skip the per-lookup mtime stat.
+        # select_autoescape is evaluated once per template compile and is already
+        # off for .md.j2 names, so markdown output (incl. <details>) is never escaped.
+        env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=select_autoescape(["html", "xml"]),
+            auto_reload=False,
+            bytecode_cache=_get_bytecode_cache(),
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+
+        # Add custom filters
+        env.filters["round"] = _round_filter
+
+        _ENV_CACHE[template_dir] = env
+        logger.info(f"✅ Jinja2 template engine initialized (templates: {template_dir})")
+    return env
+
+
+# Markdown -> HTML converters (optional 'markdown' package), one per thread since convert() mutates parser state
+_MD_LOCAL = threading.local()
+
+
+def _get_md_converter():
+    """Return this thread's markdown converter, built on its first HTML report; raises ImportError if markdown is missing."""
+    converter = getattr(_MD_LOCAL, "converter", None)
+    if converter is None:
+        import markdown
+
+        converter = _MD_LOCAL.converter = markdown.Markdown(extensions=["tables", "fenced_code", "toc"])
+    return converter
+
+
+def _tool_duration_ms(result: Any) -> float | None:
+    """Execution time of one tool result in ms, or None if it has no (parseable) timing.
+
+    Non-dict entries of tool_results (e.g. a root-level duration) yield None.
+    """
+    # execution_time_ms (JSON-first format) takes precedence over duration_s
+    try:
+        return result["execution_time_ms"]
+    except KeyError:
+        pass
+    except TypeError:
+        return None
+    # duration_s (parallel audit format) may be a string
+    try:
+        return float(result["duration_s"]) * 1000
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+def _get_tool_count(tool_results: dict[str, Any], tool: str, field: str) -> int:
+    """Read a count from one tool's results, treating a missing or malformed result as 0."""
+    # Results are dicts in practice; only pay for error handling when they are not
+    try:
+        return tool_results[tool].get(field, 0)
+    except KeyError:
+        return 0
+    except AttributeError:
+        logger.warning(f"{tool.capitalize()} data is not a dict: {type(tool_results[tool])}")
+        return 0
+
+
+class ReportGeneratorV2:
+    """Generate comprehensive markdown reports using Jinja2 templates.
+
+    Set AUDITOR_JINJA_BYTECODE_CACHE=1 to cache compiled templates on disk under
+    $XDG_CACHE_HOME (or ~/.cache)/mcp-python-auditor/jinja; see _get_bytecode_cache.
+    """
+
+    def __init__(self, reports_dir: Path):
+        self.reports_dir = reports_dir
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+
+        # Shared Jinja2 environment: templates are compiled once per process
+        self.env = _get_env(_TEMPLATE_DIR)
+
+        # Compiled report template (a cache hit after the first generator)
+        self._md_template = self.env.get_template("audit_report_v3.md.j2")
+
+    def _calculate_total_duration(self, tool_results: dict[str, Any]) -> float | None:
+        """Calculate total duration from individual tool execution times.
+
+        Handles multiple formats:
+        - execution_time_ms: milliseconds (from JSON-first architecture)
+        - duration_s: seconds (from parallel audit)
+        """
+        timed_ms = [ms for value in tool_results.values() if (ms := _tool_duration_ms(value)) is not None]
+        if timed_ms:
+            return math.fsum(timed_ms) / 1000.0  # Convert to seconds (exactly rounded sum)
+        return None
+
+    def generate_report(
+        self,
+        report_id: str,
+        project_path: str,
+        score: int,
+        tool_results: dict[str, Any],
+        timestamp: datetime,
+        scanned_files: list[str] | None = None,
+    ) -> str:
+        """Generate an audit report using Jinja2 template rendering with pre-calculated scores.
+
+        Args:
+            report_id: Unique report identifier
+            project_path: Path to the project being audited
+            score: Overall audit score (0-100) - DEPRECATED, will be calculated
+            tool_results: Raw results from all audit tools
+            timestamp: Report generation timestamp
+            scanned_files: Optional list of files that were scanned
+
+        Returns:
+            Path to the generated report file
+
+        """
+        try:
+            report_content, _ = self._render_markdown(report_id, project_path, tool_results, timestamp)
+            report_path, _ = self._write_markdown(report_id, report_content, scanned_files)
+            return str(report_path)
+
+        except Exception as e:
+            logger.error(f"❌ Report generation failed: {e}", exc_info=True)
+            raise
+
+    def _render_markdown(
+        self,
+        report_id: str,
+        project_path: str,
+        tool_results: dict[str, Any],
+        timestamp: datetime,
+    ) -> tuple[str, dict[str, Any]]:
+        """Score, render and validate the markdown report without touching disk.
+
+        Returns:
+            Tuple of (rendered markdown, template context it was rendered from)
+
+        """
+        # Step 1: Calculate scores using deterministic engine (NOT LLM!)
+        logger.info("Calculating scores using ScoringEngine...")
+        score_breakdown = ScoringEngine.calculate_score(tool_results)
+        logger.info(f"Score calculated: {score_breakdown.final_score}/100 ({score_breakdown.grade})")
+
+        # Step 2: Build normalized context
+        logger.info("Building normalized report context...")
+
+        # Extract duration from tool_results if available
+        duration = tool_results.get("duration_seconds") or tool_results.get("duration")
+        if isinstance(duration, str):
+            # Try to parse string duration (e.g., "12.34s")
+            try:
+                duration = float(duration[:-1] if duration.endswith("s") else duration)
+            except ValueError:
+                duration = None
+
+        # If no duration at root, calculate from individual tool execution times
+        if duration is None:
+            duration = self._calculate_total_duration(tool_results)
+
+        context = build_report_context(
+            raw_results=tool_results,
+            project_path=project_path,
+            score=score_breakdown.final_score,  # Use calculated score
+            report_id=report_id,
+            timestamp=timestamp,
+            duration=duration,  # ADDED: pass duration parameter
+        )
+
+        # Debug logging to identify data structure issues (skipped unless DEBUG is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"tool_results keys: {list(tool_results.keys())}")
+            if "tests" in tool_results:
+                logger.debug(f"tests type: {type(tool_results.get('tests'))}")
+
+        # Safe extraction with type validation
+        coverage = _get_tool_count(tool_results, "tests", "coverage_percent")
+        bandit_issues = _get_tool_count(tool_results, "bandit", "total_issues")
+        secrets_count = _get_tool_count(tool_results, "secrets", "total_secrets")
+
+        # Pre-classified severities (prevent hallucination)
+        context.update(
+            {
+                # Calculated scores - these WON'T change!
+                "score": score_breakdown.final_score,
+                "grade": score_breakdown.grade,
+                "security_penalty": score_breakdown.security_penalty,
+                "quality_penalty": score_breakdown.quality_penalty,
+                "testing_penalty": score_breakdown.testing_penalty,
+                "coverage_severity": _get_coverage_severity(coverage),
+                "security_severity": _get_security_severity(bandit_issues, secrets_count),
+                # Template-specific fields
+                "repo_name": _resolve_repo_name(project_path),
+                # "duration": "PRESERVED_FROM_CONTEXT", # Don't overwrite correct duration from build_report_context
+                # "timestamp" is already formatted by build_report_context
+                # Raw results for template access
+                "raw_results": tool_results,
+            }
+        )
+
+        # Step 4: Render report (template compiled in __init__)
+        logger.info("Rendering report...")
+        report_content = self._md_template.render(context)
+
+        # Step 6: Validation
+        errors = ReportValidator().validate_consistency(tool_results, report_content, score_breakdown)
+        if errors:
+            logger.warning(f"⚠️ Report inconsistencies detected: {errors}")
+            # Append warning to report (built in one join, not one concatenation per error)
+            warning_lines = "".join(f"- {error}\n" for error in errors)
+            report_content += f"\n\n---\n\n## ⚠️ Report Validation Warnings\n\n{warning_lines}"
+        else:
+            logger.info("✅ Report validation passed - no inconsistencies detected")
+
+        return report_content, context
+
+    def _write_markdown(self, report_id: str, report_content: str, scanned_files: list[str] | None) -> tuple[Path, str]:
+        """Write the rendered report, appending integrity validation if scanned_files provided.
+
+        Returns:
+            Tuple of (report path, final markdown as written)
+
+        """
+        # Step 7: Append integrity validation if scanned_files provided
+        if scanned_files:
+            report_content += self._build_integrity_section(report_content, scanned_files)
+
+        # Step 8: Encode once and write the bytes in one go (no text-layer buffering)
+        report_path = self.reports_dir / f"{report_id}.md"
+        report_path.write_bytes(report_content.encode("utf-8"))
+
+        logger.info(f"✅ Report generated successfully: {report_path}")
+        return report_path, report_content
+
+    def _build_integrity_section(self, report_text: str, scanned_files: list[str]) -> str:
+        """Build the integrity validation section to append to the report ("" if validation fails)."""
+        try:
+            from app.core.audit_validator import validate_report_integrity
+
+            # Generate validation section
+            validation_section = validate_report_integrity(report_text, scanned_files)
+
+            logger.info(f"✅ Integrity validation appended ({len(scanned_files)} files verified)")
+            return f"\n\n---\n\n{validation_section}"
+
+        except ImportError:
+            logger.warning("⚠️ audit_validator module not found, skipping integrity check")
+        except Exception as e:
+            logger.exception(f"❌ Integrity validation failed: {e}")
+        return ""
+
+    def generate_html_report(
+        self,
+        report_id: str,
+        project_path: str,
+        score: int,
+        tool_results: dict[str, Any],
+        timestamp: datetime,
+        scanned_files: list[str] | None = None,
+    ) -> str:
+        """Generate an HTML audit report with styling.
+
+        Args:
+            report_id: Unique report identifier
+            project_path: Path to the project being audited
+            score: Overall audit score (0-100) - will be recalculated
+            tool_results: Raw results from all audit tools
+            timestamp: Report generation timestamp
+            scanned_files: Optional list of files that were scanned
+
+        Returns:
+            Path to the generated HTML report file
+
+        """
+        try:
+            md_converter = _get_md_converter()
+
+            # First generate the markdown report, keeping its text and context in memory
+            report_content, context = self._render_markdown(report_id, project_path, tool_results, timestamp)
+            _, md_content = self._write_markdown(report_id, report_content, scanned_files)
+
+            # Convert to HTML
+            html_body = md_converter.reset().convert(md_content)
+
+            # Score for styling (same values the markdown report used)
+            score = context["score"]
+
+            # Determine score color
+            score_color = _SCORE_COLORS[bisect_right(_SCORE_COLOR_BOUNDS, score)]
+
+            # Wrap in HTML template
+            html_content = _HTML_SHELL.format_map(
+                {
+                    "project_name": context["project_name"],
+                    "timestamp": context["timestamp"],
+                    "score_color": score_color,
+                    "score": score,
+                    "grade": context["grade"],
+                    "html_body": html_body,
+                }
+            )
+
             # Write HTML file
             html_path = self.reports_dir / f"{report_id}.html"
-            with open(html_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
+            html_path.write_bytes(html_content.encode("utf-8"))
 
             logger.info(f"HTML report generated: {html_path}")
             return str(html_path)
@@ -7,6 +7,31 @@ from typing import Any
 
 from .scoring_engine import ScoreBreakdown
 
+# Phrases that overstate test quality when coverage is low
+_MISLEADING_PHRASES = (
+    "good coverage",
+    "excellent coverage",
+    "well tested",
+    "comprehensive tests",
+    "strong test suite",
+)
+# All phrases in one case-insensitive alternation, so the report is scanned once
+_MISLEADING_RE = re.compile("|".join(map(re.escape, _MISLEADING_PHRASES)), re.IGNORECASE)
+
+# Patterns for the figures quoted in the markdown report
+# "Score: X/100" or "Overall Score: X/100"
+_SCORE_RE = re.compile(r"(?:Overall\s+)?Score:\s*(\d+)/100", re.IGNORECASE)
+# "Coverage: 45.2%", "**Coverage**: 45.2%", then "45.2% coverage" as a fallback
+_COVERAGE_LABEL_RE = re.compile(r"\*?\*?Coverage\*?\*?[:\s]+(\d+\.?\d*)%", re.IGNORECASE)
+_COVERAGE_SUFFIX_RE = re.compile(r"(\d+\.?\d*)%\s+coverage", re.IGNORECASE)
+# Word both coverage patterns contain; a literal scan for it is far cheaper than either pattern
+_COVERAGE_WORD_RE = re.compile("coverage", re.IGNORECASE)
+# "X issues, Y secrets"
+_SECURITY_RE = re.compile(r"(\d+)\s+issues,\s+(\d+)\s+secrets")
+# "X dead code items", then "X items found" as a fallback
+_DEAD_CODE_RE = re.compile(r"(\d+)\s+dead code items")
+_DEAD_CODE_FOUND_RE = re.compile(r"(\d+)\s+items found")
+
 
 class ReportValidator:
     """Validates consistency between JSON data and generated report"""
@@ -28,15 +53,9 @@ class ReportValidator:
 
         # Check for misleading language
         if json_coverage < 30:
-            misleading_phrases = [
-                "good coverage",
-                "excellent coverage",
-                "well tested",
-                "comprehensive tests",
-                "strong test suite",
-            ]
-            for phrase in misleading_phrases:
-                if phrase.lower() in markdown_report.lower():
+            found = {match.lower() for match in _MISLEADING_RE.findall(markdown_report)}
+            for phrase in _MISLEADING_PHRASES:
+                if phrase in found:
                     errors.append(f"Misleading phrase '{phrase}' found for {json_coverage}% coverage")
 
         # Validate security issues count
@@ -58,37 +77,42 @@ class ReportValidator:
 
     def _extract_score(self, markdown: str) -> int | None:
         """Extract overall score from markdown"""
-        # Match "Score: X/100" or "Overall Score: X/100"
-        match = re.search(r"(?:Overall\s+)?Score:\s*(\d+)/100", markdown, re.IGNORECASE)
+        match = _SCORE_RE.search(markdown)
         if match:
             return int(match.group(1))
         return None
 
     def _extract_coverage(self, markdown: str) -> float | None:
         """Extract coverage percentage from markdown"""
-        # Look for patterns like "Coverage: 45.2%", "**Coverage**: 45.2%", or "45.2% coverage"
-        match = re.search(r"\*?\*?Coverage\*?\*?[:\s]+(\d+\.?\d*)%", markdown, re.IGNORECASE)
+        if not _COVERAGE_WORD_RE.search(markdown):
+            return None
+        match = _COVERAGE_LABEL_RE.search(markdown)
         if match:
             return float(match.group(1))
-        match = re.search(r"(\d+\.?\d*)%\s+coverage", markdown, re.IGNORECASE)
+        match = _COVERAGE_SUFFIX_RE.search(markdown)
         if match:
             return float(match.group(1))
         return None
 
     def _extract_security_count(self, markdown: str) -> int | None:
         """Extract total security issues count"""
-        # Look for "X issues, Y secrets" pattern
-        match = re.search(r"(\d+)\s+issues,\s+(\d+)\s+secrets", markdown)
+        # Every match contains "issues,"; a substring check rejects reports without it far faster than the regex scan
+        if "issues," not in markdown:
+            return None
+        match = _SECURITY_RE.search(markdown)
         if match:
             return int(match.group(1)) + int(match.group(2))
         return None
 
     def _extract_dead_code_count(self, markdown: str) -> int | None:
         """Extract dead code count"""
-        match = re.search(r"(\d+)\s+dead code items", markdown)
-        if match:
-            return int(match.group(1))
-        match = re.search(r"(\d+)\s+items found", markdown)
-        if match:
-            return int(match.group(1))
+        # Same literal pre-check as _extract_security_count, per pattern
+        if "dead code items" in markdown:
+            match = _DEAD_CODE_RE.search(markdown)
+            if match:
+                return int(match.group(1))
+        if "items found" in markdown:
+            match = _DEAD_CODE_FOUND_RE.search(markdown)
+            if match:
+                return int(match.group(1))
         return None
@@ -6,6 +6,7 @@ Each tool has its own cache file in .audit_index/ directory.
 
 import json
 import logging
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -14,7 +15,7 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedResult:
     """Represents a cached tool result."""
 
@@ -77,9 +78,6 @@ class ResultCache:
             return self._caches[tool_name]
 
         cache_file = self._cache_file(tool_name)
-        if not cache_file.exists():
-            return None
-
         try:
             with open(cache_file, encoding="utf-8") as f:
                 data = json.load(f)
@@ -87,6 +85,9 @@ class ResultCache:
                 self._caches[tool_name] = result
                 logger.info(f"Loaded {tool_name} cache ({len(result.file_results)} files)")
                 return result
+        except FileNotFoundError:
+            # No cache yet (open() doubles as the existence check)
+            return None
         except (OSError, json.JSONDecodeError) as e:
             logger.warning(f"Failed to load {tool_name} cache: {e}")
             return None
@@ -97,8 +98,10 @@ class ResultCache:
         cache_file = self._cache_file(tool_name)
 
         try:
+            # Machine-read cache: compact output keeps json on its C encoder (indent uses the pure-Python one)
+            payload = json.dumps(result.to_dict(), separators=(",", ":"))
             with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(result.to_dict(), f, indent=2)
+                f.write(payload)
             self._caches[tool_name] = result
             logger.info(f"Saved {tool_name} cache ({len(result.file_results)} files)")
         except OSError as e:
@@ -129,32 +132,41 @@ class ResultCache:
             # No cache, return new results as-is
             return new_results
 
-        # Start with cached file results
+        # Start with cached file results, tracking whether the merge changes any of them
         merged_file_results = dict(cached.file_results)
+        dirty = False
 
         # Remove deleted files
         for file_path in deleted_files:
-            merged_file_results.pop(file_path, None)
+            if file_path in merged_file_results:
+                del merged_file_results[file_path]
+                dirty = True
 
         # Update with new results for changed files
         new_file_results = self._extract_file_results(tool_name, new_results)
         for file_path in changed_files:
             if file_path in new_file_results:
-                merged_file_results[file_path] = new_file_results[file_path]
+                file_result = new_file_results[file_path]
+                if merged_file_results.get(file_path) != file_result:
+                    merged_file_results[file_path] = file_result
+                    dirty = True
 
         # Re-aggregate metrics
         merged = self._aggregate_results(tool_name, merged_file_results)
 
-        # Save updated cache
-        self.save_cache(
-            tool_name,
-            CachedResult(
-                tool_name=tool_name,
-                timestamp=datetime.now().isoformat(),
-                file_results=merged_file_results,
-                aggregated=merged,
-            ),
-        )
+        # Save updated cache (an unchanged merge leaves the cache file as it is)
+        if dirty:
+            self.save_cache(
+                tool_name,
+                CachedResult(
+                    tool_name=tool_name,
+                    timestamp=datetime.now().isoformat(),
+                    file_results=merged_file_results,
+                    aggregated=merged,
+                ),
+            )
+        else:
+            logger.info(f"{tool_name} cache unchanged by merge, skipping rewrite")
 
         return merged
 
@@ -327,11 +339,16 @@ class ResultCache:
     def clear_all_caches(self) -> int:
         """Clear all tool caches. Returns count of cleared files."""
         cleared = 0
-        if self.cache_dir.exists():
-            for cache_file in self.cache_dir.glob("*_results.json"):
-                cache_file.unlink()
-                cleared += 1
+        # scandir entries carry their file type, so no Path objects or extra stats per entry
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith("_results.json") and entry.is_file():
+                        os.unlink(entry.path)
+                        cleared += 1
             self._caches.clear()
+        except FileNotFoundError:
+            pass  # No cache directory yet
         logger.info(f"Cleared {cleared} cache files")
         return cleared
 
@@ -344,17 +361,21 @@ class ResultCache:
         }
 
         for tool in self.INCREMENTAL_TOOLS:
-            cache_file = self._cache_file(tool)
-            if cache_file.exists():
-                cached = self.load_cache(tool)
-                if cached:
-                    stats["tools"][tool] = {
-                        "files_cached": len(cached.file_results),
-                        "timestamp": cached.timestamp,
-                        "size_kb": round(cache_file.stat().st_size / 1024, 1),
-                    }
-            else:
+            # One stat gives both existence and size
+            try:
+                size = self._cache_file(tool).stat().st_size
+            except OSError:
                 stats["tools"][tool] = {"cached": False}
+                continue
+
+            # Served from memory when this instance already loaded or saved the cache
+            cached = self.load_cache(tool)
+            if cached:
+                stats["tools"][tool] = {
+                    "files_cached": len(cached.file_results),
+                    "timestamp": cached.timestamp,
+                    "size_kb": round(size / 1024, 1),
+                }
 
         return stats
 
@@ -83,9 +83,9 @@ class ScoringEngine:
 
         duplication = audit_results.get("duplication", {})
         # Count only duplicates with similarity > 95% (not test helpers)
-        exact_dups = [d for d in duplication.get("duplicates", []) if d.get("similarity", 0) > 95]
-        if len(exact_dups) > 10:
-            breakdown.quality_penalty += min(len(exact_dups) - 10, 15)
+        exact_dups = sum(1 for d in duplication.get("duplicates", []) if d.get("similarity", 0) > 95)
+        if exact_dups > 10:
+            breakdown.quality_penalty += min(exact_dups - 10, 15)
 
         # Maintenance penalty - cleanup items (cache dirs, temp files, old reports)
         cleanup = audit_results.get("cleanup", {})
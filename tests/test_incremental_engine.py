@@ -189,6 +189,45 @@ class TestIncrementalEngine:
         
         assert cleared == 1
     
+    def test_merge_without_changes_skips_cache_rewrite(self, temp_project):
+        """Test that a merge which changes no per-file results does not rewrite the cache."""
+        from app.core.result_cache import CachedResult
+        cache = ResultCache(temp_project)
+        issue = {"filename": "main.py", "issue": "assert used"}
+        cache.save_cache("bandit", CachedResult(
+            tool_name="bandit",
+            timestamp="2026-01-23T09:00:00",
+            file_results={"main.py": [issue]},
+            aggregated={"status": "issues_found"}
+        ))
+
+        with patch.object(cache, "save_cache") as save:
+            merged = cache.merge_results("bandit", {"issues": [issue]}, ["main.py"], ["gone.py"])
+            save.assert_not_called()
+
+            cache.merge_results("bandit", {"issues": []}, ["main.py"], ["main.py"])
+            save.assert_called_once()
+
+        assert merged["total_issues"] == 1
+
+    def test_cache_stats_reports_cached_and_missing_tools(self, temp_project):
+        """Test cache stats for a saved tool cache and a tool without one."""
+        from app.core.result_cache import CachedResult
+        cache = ResultCache(temp_project)
+        cache.save_cache("bandit", CachedResult(
+            tool_name="bandit",
+            timestamp="2026-01-23T09:00:00",
+            file_results={"main.py": [], "utils.py": []},
+            aggregated={"status": "clean"}
+        ))
+
+        # A fresh instance has to read the file from disk
+        for stats_cache in (cache, ResultCache(temp_project)):
+            tools = stats_cache.get_cache_stats()["tools"]
+            assert tools["bandit"]["files_cached"] == 2
+            assert tools["bandit"]["timestamp"] == "2026-01-23T09:00:00"
+            assert tools["ruff"] == {"cached": False}
+
     def test_get_stats(self, temp_project):
         """Test getting engine statistics."""
         engine = IncrementalEngine(temp_project)
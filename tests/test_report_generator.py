@@ -0,0 +1,99 @@
+"""
+Unit tests for the markdown report generators (v1 ReportGenerator and ReportGeneratorV2).
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+from app.core import report_generator_v2
+from app.core.report_generator import ReportGenerator
+from app.core.report_generator_v2 import ReportGeneratorV2, _get_bytecode_cache
+
+
+class TestReportGeneratorHeader:
+    """Test the report header written by ReportGenerator"""
+
+    def test_header_names_project_directory(self, tmp_path):
+        """Test that the header uses the project directory name, ignoring a trailing slash"""
+        project = tmp_path / "my_project"
+        project.mkdir()
+
+        report_path = ReportGenerator(tmp_path / "reports").generate_report("r", f"{project}/", 87, {})
+        lines = Path(report_path).read_text(encoding="utf-8").splitlines()
+
+        assert lines[0] == "# Project Audit: my_project"
+        assert lines[1] == "**Score:** 87/100 → **Target: 90/100** (via 3 fixes)"
+
+    def test_header_resolves_relative_project_path(self, tmp_path, monkeypatch):
+        """Test that '.' is rendered as the current directory's name, not '.'"""
+        project = tmp_path / "cwd_project"
+        project.mkdir()
+        monkeypatch.chdir(project)
+
+        report_path = ReportGenerator(tmp_path / "reports").generate_report("r", ".", 50, {})
+        header = Path(report_path).read_text(encoding="utf-8").splitlines()[0]
+        assert header == "# Project Audit: cwd_project"
+
+
+class TestReportGeneratorV2Validation:
+    """Test that ReportGeneratorV2 reports carry the validator's warnings"""
+
+    def test_penalty_free_run_still_reports_mismatches(self, tmp_path):
+        """Zero score penalties must not skip validation of the rendered security/deadcode sections"""
+        tool_results = {
+            "tests": {"coverage_percent": 85.27},
+            "security": {
+                "total_issues": 4,
+                "issues": [{"file": "a.py", "line": i, "severity": "LOW", "issue": "x"} for i in range(4)],
+            },
+            "deadcode": {
+                "total_dead": 7,
+                "dead_functions": [{"file": "a.py", "name": f"f{i}", "line": i} for i in range(7)],
+            },
+        }
+
+        report_path = ReportGeneratorV2(tmp_path / "reports").generate_report(
+            "r", str(tmp_path / "project"), 0, tool_results, datetime(2026, 1, 23, 9, 0)
+        )
+        report = Path(report_path).read_text(encoding="utf-8")
+
+        assert "## ⚠️ Report Validation Warnings" in report
+        assert "Security count mismatch: JSON=0, Report=4" in report
+        assert "Dead code mismatch: JSON=0, Report=7" in report
+
+
+class TestReportGeneratorV2BytecodeCache:
+    """Test the opt-in AUDITOR_JINJA_BYTECODE_CACHE on-disk template cache"""
+
+    def test_cache_enabled_writes_bytecode_and_renders_identically(self, tmp_path, monkeypatch):
+        """Enabling the cache must populate the cache directory without changing the rendered report"""
+        tool_results = {"tests": {"coverage_percent": 85.0}}
+        timestamp = datetime(2026, 1, 23, 9, 0)
+        project = str(tmp_path / "project")
+
+        monkeypatch.delenv("AUDITOR_JINJA_BYTECODE_CACHE", raising=False)
+        monkeypatch.setattr(report_generator_v2, "_ENV_CACHE", {})
+        uncached = ReportGeneratorV2(tmp_path / "plain").generate_report("r", project, 90, tool_results, timestamp)
+
+        cache_root = tmp_path / "cache"
+        monkeypatch.setenv("AUDITOR_JINJA_BYTECODE_CACHE", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(cache_root))
+        monkeypatch.setattr(report_generator_v2, "_ENV_CACHE", {})
+        cached = ReportGeneratorV2(tmp_path / "cached").generate_report("r", project, 90, tool_results, timestamp)
+
+        cache_dir = cache_root / "mcp-python-auditor" / "jinja"
+        assert cache_dir.is_dir()
+        assert any(cache_dir.iterdir())
+        assert Path(cached).read_text(encoding="utf-8") == Path(uncached).read_text(encoding="utf-8")
+
+    def test_unresolvable_home_disables_cache(self, monkeypatch):
+        """A missing HOME must disable the cache instead of failing generator construction"""
+
+        def no_home():
+            raise RuntimeError("Could not determine home directory.")
+
+        monkeypatch.setenv("AUDITOR_JINJA_BYTECODE_CACHE", "1")
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setattr(Path, "home", no_home)
+
+        assert _get_bytecode_cache() is None
@@ -103,6 +103,24 @@ class TestReportValidator:
         assert len(errors) >= 2  # Should catch both "good coverage" and "well tested"
         assert any("good coverage" in error for error in errors)
         assert any("well tested" in error for error in errors)
+
+    def test_misleading_language_case_insensitive_reported_once(self):
+        """Test that misleading phrases match any case and are reported once each, in phrase order"""
+        json_data = {"tests": {"coverage_percent": 5}}
+
+        markdown = """
+        Well Tested code with EXCELLENT COVERAGE.
+        Truly well tested.
+        """
+
+        breakdown = ScoreBreakdown(base_score=100)
+
+        validator = ReportValidator()
+        errors = validator.validate_consistency(json_data, markdown, breakdown)
+        assert errors == [
+            "Misleading phrase 'excellent coverage' found for 5% coverage",
+            "Misleading phrase 'well tested' found for 5% coverage",
+        ]
     
     def test_security_count_mismatch(self):
         """Test that security issue count mismatches are detected"""
@@ -209,6 +227,15 @@ class TestReportValidator:
         
         assert validator._extract_dead_code_count("15 dead code items") == 15
         assert validator._extract_dead_code_count("25 items found") == 25
+
+    def test_extract_counts_absent(self):
+        """Test count extraction returns None when the report has no such figure"""
+        validator = ReportValidator()
+
+        assert validator._extract_security_count("## Security\n\nNo issues found") is None
+        assert validator._extract_security_count("issues, but no count") is None
+        assert validator._extract_dead_code_count("No dead code detected") is None
+        assert validator._extract_dead_code_count("dead code items: none, 3 items found") == 3
     
     def test_no_false_positives_on_good_report(self):
         """Test that a well-written accurate report has no errors"""